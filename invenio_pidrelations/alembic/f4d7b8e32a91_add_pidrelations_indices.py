@@ -0,0 +1,43 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of Invenio.
+# Copyright (C) 2025 CERN.
+#
+# Invenio is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""Add pidrelations indices."""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "f4d7b8e32a91"
+down_revision = "1d4e361b7586"
+branch_labels = ()
+depends_on = None
+
+
+def upgrade():
+    """Upgrade database."""
+    op.create_index(
+        "ix_pidrelations_pidrelation_parent_relation_index",
+        "pidrelations_pidrelation",
+        ["parent_id", "relation_type", "index"],
+    )
+    op.create_index(
+        "ix_pidrelations_pidrelation_child_relation",
+        "pidrelations_pidrelation",
+        ["child_id", "relation_type"],
+    )
+
+
+def downgrade():
+    """Downgrade database."""
+    op.drop_index(
+        "ix_pidrelations_pidrelation_child_relation",
+        table_name="pidrelations_pidrelation",
+    )
+    op.drop_index(
+        "ix_pidrelations_pidrelation_parent_relation_index",
+        table_name="pidrelations_pidrelation",
+    )
@@ -10,17 +10,56 @@
 
 from __future__ import absolute_import, print_function
 
+import contextlib
+
+from flask import current_app
 from invenio_db import db
+from invenio_pidstore.errors import PIDDoesNotExistError
 from invenio_pidstore.models import PersistentIdentifier, PIDStatus
-from sqlalchemy import and_, select
-from sqlalchemy.exc import IntegrityError
+from sqlalchemy import (
+    and_,
+    event,
+    exists,
+    insert,
+    literal,
+    null,
+    select,
+    tuple_,
+    update,
+)
+from sqlalchemy.exc import IntegrityError, NoResultFound
 from sqlalchemy.orm import aliased
-from werkzeug.utils import cached_property
 
 from .errors import PIDRelationConsistencyError
 from .models import PIDRelation
 
 
+class cached_property:
+    """Lock-free replacement for werkzeug's cached_property.
+
+    PIDNode instances are request-local, so the synchronization that
+    werkzeug's implementation adds is pure overhead here. As a non-data
+    descriptor, the value stored in the instance ``__dict__`` shadows the
+    descriptor entirely on later accesses.
+    """
+
+    def __init__(self, func):
+        """Constructor.
+
+        :param func: the decorated method computing the value.
+        """
+        self.func = func
+        self.__name__ = func.__name__
+        self.__doc__ = func.__doc__
+
+    def __get__(self, instance, owner=None):
+        """Compute the value and cache it in the instance ``__dict__``."""
+        if instance is None:
+            return self
+        value = instance.__dict__[self.__name__] = self.func(instance)
+        return value
+
+
 class PIDQuery:
     """Legacy-style query wrapper for PIDNodes APIs when requesting related PIDs..
 
@@ -91,14 +130,19 @@ class PIDQuery:
         )
 
     def count(self):
-        """Count the results of the query."""
+        """Count the results of the query.
+
+        Counts over the statement's own FROM/WHERE instead of wrapping it
+        in a subquery, so the database does not have to materialize every
+        projected column just to throw it away.
+        """
         return self._session.scalar(
-            select(db.func.count()).select_from(self._statement.subquery())
+            self._statement.with_only_columns(db.func.count()).order_by(None)
         )
 
     def first(self):
         """Get the first result."""
-        return self._session.scalars(self._statement.limit(1)).first()
+        return self._session.scalar(self._statement.limit(1))
 
     def one(self):
         """Get exactly one result."""
@@ -112,23 +156,123 @@ class PIDQuery:
         """Get all results."""
         return self._session.scalars(self._statement).all()
 
+    def iter(self, batch=1000):
+        """Iterate over the results, fetching them in batches.
+
+        Unlike :meth:`all`, the full result set is never materialized in
+        memory at once, which matters for parents with thousands of
+        children.
+
+        :param batch: number of rows fetched from the database at a time.
+        """
+        return self._session.scalars(self._statement.execution_options(yield_per=batch))
+
     def exists(self):
-        """Check if any results exist."""
-        return self._session.scalar(
-            select(1).select_from(self._statement.subquery()).exists().select()
+        """Check if any results exist.
+
+        Issues a plain ``SELECT 1 ... LIMIT 1`` over the statement's own
+        FROM clause instead of wrapping it in an EXISTS subquery, which the
+        planner handles much better.
+        """
+        return (
+            self._session.scalar(self._statement.with_only_columns(literal(1)).limit(1))
+            is not None
         )
 
 
+_RESOLVE_CACHE_KEY = "_pidrelations_resolve_cache"
+"""Key of the per-session resolved-PID cache in ``session.info``."""
+
+
+def _clear_resolve_cache(session):
+    """Drop the per-session resolved-PID cache."""
+    session.info.pop(_RESOLVE_CACHE_KEY, None)
+
+
+event.listen(db.session, "after_commit", _clear_resolve_cache)
+event.listen(db.session, "after_rollback", _clear_resolve_cache)
+
+
 def resolve_pid(fetched_pid):
     """Retrieve the real PID given a fetched PID.
 
+    The same fetched PID is often resolved several times within one
+    request (limit checks, inserts, sibling lookups), so resolved PIDs are
+    cached in ``session.info`` for the lifetime of the current transaction.
+
     :param pid: fetched PID to resolve.
     """
-    return PersistentIdentifier.get(
-        pid_type=fetched_pid.pid_type,
-        pid_value=fetched_pid.pid_value,
-        pid_provider=fetched_pid.provider.pid_provider,
+    cache = db.session.info.setdefault(_RESOLVE_CACHE_KEY, {})
+    key = (
+        fetched_pid.pid_type,
+        fetched_pid.pid_value,
+        fetched_pid.provider.pid_provider,
+    )
+    pid = cache.get(key)
+    if pid is None:
+        pid = PersistentIdentifier.get(
+            pid_type=fetched_pid.pid_type,
+            pid_value=fetched_pid.pid_value,
+            pid_provider=fetched_pid.provider.pid_provider,
+        )
+        cache[key] = pid
+    return pid
+
+
+def resolve_pids(fetched_pids):
+    """Retrieve the real PIDs of multiple fetched PIDs with a single query.
+
+    Use this instead of calling :func:`resolve_pid` in a loop: it collapses
+    one SELECT per fetched PID into a single SELECT ... IN query.
+
+    :param fetched_pids: iterable of fetched PIDs to resolve.
+    :returns: dict mapping ``(pid_type, pid_value, pid_provider)`` tuples to
+        the resolved :class:`PersistentIdentifier` instances. Unresolvable
+        PIDs are absent from the result.
+    """
+    keys = {(p.pid_type, p.pid_value): p.provider.pid_provider for p in fetched_pids}
+    if not keys:
+        return {}
+    stmt = select(PersistentIdentifier).where(
+        tuple_(PersistentIdentifier.pid_type, PersistentIdentifier.pid_value).in_(
+            list(keys)
+        )
     )
+    resolved = {}
+    for pid in db.session.scalars(stmt):
+        pid_provider = keys[(pid.pid_type, pid.pid_value)]
+        # Mirror PersistentIdentifier.get(): the provider only discriminates
+        # when one was requested.
+        if pid_provider and pid.pid_provider != pid_provider:
+            continue
+        resolved[(pid.pid_type, pid.pid_value, pid_provider)] = pid
+    return resolved
+
+
+def _savepoint_context():
+    """Return a savepoint context, or a no-op one unless configured.
+
+    On PostgreSQL every ``begin_nested()`` issues a SAVEPOINT/RELEASE
+    round-trip pair, which is redundant around a lone statement: the
+    caller's transaction already provides rollback semantics. Savepoints
+    around such statements are therefore opt-in through the
+    ``PIDRELATIONS_USE_SAVEPOINT`` configuration variable.
+
+    Only use this for genuine single-statement paths. Multi-statement
+    units (sibling shifts plus insert, delete plus reorder, batch
+    inserts) must keep an unconditional ``begin_nested()``.
+    """
+    if current_app.config.get("PIDRELATIONS_USE_SAVEPOINT", False):
+        return db.session.begin_nested()
+    return contextlib.nullcontext()
+
+
+_TO_PID = aliased(PersistentIdentifier, name="to_pid")
+"""Destination-side PID alias shared by all ``_connected_pids`` statements.
+
+Alias construction is non-trivial SQLAlchemy work and the alias itself is
+stateless, so it is built once at import time.
+"""
 
 
 class PIDNode(object):
@@ -161,31 +305,149 @@ class PIDNode(object):
         return self.pid
 
     def _get_child_relation(self, child_pid):
-        """Retrieve the relation between this node and a child PID."""
-        stmt = select(PIDRelation).filter_by(
-            parent=self._resolved_pid,
-            child=child_pid,
-            relation_type=self.relation_type.id,
+        """Retrieve the relation between this node and a child PID.
+
+        The lookup goes by primary key through the session identity map,
+        so no query is issued when the relation is already loaded (e.g.
+        right after an insert_child in the same session).
+        """
+        relation = db.session.get(
+            PIDRelation,
+            {
+                "parent_id": self._resolved_pid.id,
+                "child_id": child_pid.id,
+                "relation_type": self.relation_type.id,
+            },
         )
-        return db.session.execute(stmt).scalar_one()
+        if relation is None:
+            raise NoResultFound("No row was found when one was required")
+        return relation
 
     def _check_child_limits(self, child_pid):
-        """Check that inserting a child is within the limits."""
-        if self.max_children is not None and self.children.count() >= self.max_children:
-            raise PIDRelationConsistencyError(
-                "Max number of children is set to {}.".format(self.max_children)
+        """Check that inserting a child is within the limits.
+
+        Only whether a limit has been reached matters, not the exact number
+        of relations, so the counted subqueries are bounded with a LIMIT to
+        stop the database from scanning the full relation set.
+        """
+        rtid = self.relation_type.id
+        if self.max_children is not None:
+            stmt = select(db.func.count()).select_from(
+                select(PIDRelation.child_id)
+                .where(
+                    PIDRelation.parent_id == self._resolved_pid.id,
+                    PIDRelation.relation_type == rtid,
+                )
+                .limit(self.max_children + 1)
+                .subquery()
             )
+            if db.session.execute(stmt).scalar() >= self.max_children:
+                raise PIDRelationConsistencyError(
+                    "Max number of children is set to {}.".format(self.max_children)
+                )
         if self.max_parents is not None:
-            stmt = (
-                select(db.func.count())
-                .select_from(PIDRelation)
-                .filter_by(child=child_pid, relation_type=self.relation_type.id)
+            stmt = select(db.func.count()).select_from(
+                select(PIDRelation.parent_id)
+                .filter_by(child=child_pid, relation_type=rtid)
+                .limit(self.max_parents + 1)
+                .subquery()
             )
             if db.session.execute(stmt).scalar() >= self.max_parents:
                 raise PIDRelationConsistencyError(
                     "This pid already has the maximum number of parents."
                 )
 
+    def _resolve_child_pids(self, child_pids):
+        """Resolve a mixed list of PIDs and fetched PIDs with one query."""
+        fetched = [p for p in child_pids if not isinstance(p, PersistentIdentifier)]
+        resolved = resolve_pids(fetched)
+        children = []
+        for child_pid in child_pids:
+            if isinstance(child_pid, PersistentIdentifier):
+                children.append(child_pid)
+                continue
+            key = (
+                child_pid.pid_type,
+                child_pid.pid_value,
+                child_pid.provider.pid_provider,
+            )
+            if key not in resolved:
+                raise PIDDoesNotExistError(child_pid.pid_type, child_pid.pid_value)
+            children.append(resolved[key])
+        return children
+
+    def _check_children_limits(self, children):
+        """Check that inserting a batch of children is within the limits.
+
+        The max_parents check runs as one grouped count over the whole
+        batch instead of one count per child.
+        """
+        rtid = self.relation_type.id
+        if self.max_children is not None:
+            stmt = select(db.func.count()).select_from(
+                select(PIDRelation.child_id)
+                .where(
+                    PIDRelation.parent_id == self._resolved_pid.id,
+                    PIDRelation.relation_type == rtid,
+                )
+                .limit(self.max_children + 1)
+                .subquery()
+            )
+            if db.session.execute(stmt).scalar() + len(children) > self.max_children:
+                raise PIDRelationConsistencyError(
+                    "Max number of children is set to {}.".format(self.max_children)
+                )
+        if self.max_parents is not None:
+            stmt = (
+                select(PIDRelation.child_id, db.func.count())
+                .where(
+                    PIDRelation.child_id.in_([c.id for c in children]),
+                    PIDRelation.relation_type == rtid,
+                )
+                .group_by(PIDRelation.child_id)
+            )
+            for _, parent_count in db.session.execute(stmt):
+                if parent_count >= self.max_parents:
+                    raise PIDRelationConsistencyError(
+                        "This pid already has the maximum number of parents."
+                    )
+
+    def insert_children(self, child_pids):
+        """Add the given PIDs to the list of children PIDs in one batch.
+
+        Fetched PIDs are resolved with a single query, the limits are
+        checked once for the whole batch and the relations are inserted
+        with a single executemany INSERT, instead of repeating the full
+        insert_child statement chain per child.
+        """
+        children = self._resolve_child_pids(list(child_pids))
+        if not children:
+            return
+        self._check_children_limits(children)
+        parent_id = self._resolved_pid.id
+        rtid = self.relation_type.id
+        try:
+            # Always a real savepoint: a duplicate in the batch surfaces as
+            # IntegrityError, which would otherwise abort the enclosing
+            # transaction on PostgreSQL.
+            with db.session.begin_nested():
+                db.session.execute(
+                    insert(PIDRelation),
+                    [
+                        dict(
+                            parent_id=parent_id,
+                            child_id=child.id,
+                            relation_type=rtid,
+                            index=None,
+                        )
+                        for child in children
+                    ],
+                )
+        except IntegrityError:
+            raise PIDRelationConsistencyError("PID Relation already exists.")
+        finally:
+            self._invalidate_relations_cache()
+
     def _connected_pids(self, from_parent=True):
         """Follow a relationship to find connected PIDs.
 
@@ -193,7 +455,6 @@ class PIDNode(object):
         search for its parents.
         :type from_parent: bool
         """
-        to_pid = aliased(PersistentIdentifier, name="to_pid")
         if from_parent:
             to_relation_id = PIDRelation.child_id
             from_relation_id = PIDRelation.parent_id
@@ -201,41 +462,98 @@ class PIDNode(object):
             to_relation_id = PIDRelation.parent_id
             from_relation_id = PIDRelation.child_id
 
-        initial_stmt = select(to_pid).join(
-            PIDRelation,
-            and_(
-                to_pid.id == to_relation_id,
-                PIDRelation.relation_type == self.relation_type.id,
-            ),
+        # Fetched PIDs are resolved once (and cached), so the source side
+        # always filters on the resolved PID id: this avoids joining a
+        # second PID alias on every parents/children query.
+        stmt = (
+            select(_TO_PID)
+            .join(
+                PIDRelation,
+                and_(
+                    _TO_PID.id == to_relation_id,
+                    PIDRelation.relation_type == self.relation_type.id,
+                ),
+            )
+            .where(from_relation_id == self._resolved_pid.id)
         )
+        return PIDQuery(stmt, db.session(), _filtered_pid_class=_TO_PID)
 
-        query_builder = PIDQuery(initial_stmt, db.session(), _filtered_pid_class=to_pid)
+    def _transitively_connected_pids(self, from_parent=True, max_depth=None):
+        """Follow a relationship transitively to find all connected PIDs.
 
-        # Accept both PersistentIdentifier models and fake PIDs with just
-        # pid_value, pid_type as they are fetched with the PID fetcher.
-        if isinstance(self.pid, PersistentIdentifier):
-            query_builder = query_builder.filter(from_relation_id == self.pid.id)
+        Issues a single recursive CTE query instead of one query per
+        traversed level.
+
+        :param from_parent: search descendants of the current pid if True,
+        else search for its ancestors.
+        :type from_parent: bool
+        :param max_depth: maximum traversal depth, unlimited if None.
+        """
+        if from_parent:
+            to_relation_id = PIDRelation.child_id
+            from_relation_id = PIDRelation.parent_id
         else:
-            from_pid = aliased(PersistentIdentifier, name="from_pid")
-            query_builder = query_builder.join(
-                from_pid, from_pid.id == from_relation_id
-            ).filter(
-                from_pid.pid_value == self.pid.pid_value,
-                from_pid.pid_type == self.pid.pid_type,
+            to_relation_id = PIDRelation.parent_id
+            from_relation_id = PIDRelation.child_id
+
+        connected = (
+            select(to_relation_id.label("pid_id"), literal(1).label("depth"))
+            .where(
+                from_relation_id == self._resolved_pid.id,
+                PIDRelation.relation_type == self.relation_type.id,
             )
+            .cte("connected_pids", recursive=True)
+        )
+        recursive_stmt = select(to_relation_id, connected.c.depth + 1).where(
+            from_relation_id == connected.c.pid_id,
+            PIDRelation.relation_type == self.relation_type.id,
+        )
+        if max_depth is not None:
+            recursive_stmt = recursive_stmt.where(connected.c.depth < max_depth)
+        connected = connected.union_all(recursive_stmt)
 
-        return query_builder
+        stmt = select(PersistentIdentifier).join(
+            connected, PersistentIdentifier.id == connected.c.pid_id
+        )
+        return PIDQuery(stmt, db.session())
 
-    @property
+    def descendants(self, max_depth=None):
+        """Retrieve all transitively connected child PIDs.
+
+        :param max_depth: maximum traversal depth, unlimited if None.
+        """
+        return self._transitively_connected_pids(from_parent=True, max_depth=max_depth)
+
+    def ancestors(self, max_depth=None):
+        """Retrieve all transitively connected parent PIDs.
+
+        :param max_depth: maximum traversal depth, unlimited if None.
+        """
+        return self._transitively_connected_pids(from_parent=False, max_depth=max_depth)
+
+    @cached_property
     def parents(self):
-        """Retrieves all parent PIDs."""
+        """Retrieves all parent PIDs.
+
+        The returned PIDQuery is cached: building the underlying select()
+        is pure CPU work and the query methods derive new PIDQuery
+        instances, so the base statement is safe to share.
+        """
         return self._connected_pids(from_parent=False)
 
-    @property
+    @cached_property
     def children(self):
-        """Retrieves all child PIDs."""
+        """Retrieves all child PIDs.
+
+        The returned PIDQuery is cached, see :attr:`parents`.
+        """
         return self._connected_pids(from_parent=True)
 
+    def _invalidate_relations_cache(self):
+        """Drop the cached parents/children query builders."""
+        self.__dict__.pop("parents", None)
+        self.__dict__.pop("children", None)
+
     @property
     def is_parent(self):
         """Test if the given PID has any children."""
@@ -247,31 +565,90 @@ class PIDNode(object):
         return self.parents.exists()
 
     def insert_child(self, child_pid):
-        """Add the given PID to the list of children PIDs."""
-        self._check_child_limits(child_pid)
-        try:
-            # TODO: Here add the check for the max parents and the max children
-            with db.session.begin_nested():
-                if not isinstance(child_pid, PersistentIdentifier):
-                    child_pid = resolve_pid(child_pid)
-                return PIDRelation.create(
-                    self._resolved_pid, child_pid, self.relation_type.id, None
+        """Add the given PID to the list of children PIDs.
+
+        The existence and limit checks are folded into the INSERT statement
+        itself so that the happy path costs a single round-trip. Only when
+        the insert touches no row are the checks re-run separately to report
+        which condition failed.
+
+        :returns: the created :class:`PIDRelation`.
+        """
+        if not isinstance(child_pid, PersistentIdentifier):
+            child_pid = resolve_pid(child_pid)
+        parent_id = self._resolved_pid.id
+        rtid = self.relation_type.id
+        conditions = [
+            ~exists(
+                select(PIDRelation.parent_id).where(
+                    PIDRelation.parent_id == parent_id,
+                    PIDRelation.child_id == child_pid.id,
+                    PIDRelation.relation_type == rtid,
+                )
+            )
+        ]
+        if self.max_children is not None:
+            conditions.append(
+                select(db.func.count())
+                .select_from(
+                    select(PIDRelation.child_id)
+                    .where(
+                        PIDRelation.parent_id == parent_id,
+                        PIDRelation.relation_type == rtid,
+                    )
+                    .limit(self.max_children + 1)
+                    .subquery()
+                )
+                .scalar_subquery()
+                < self.max_children
+            )
+        if self.max_parents is not None:
+            conditions.append(
+                select(db.func.count())
+                .select_from(
+                    select(PIDRelation.parent_id)
+                    .where(
+                        PIDRelation.child_id == child_pid.id,
+                        PIDRelation.relation_type == rtid,
+                    )
+                    .limit(self.max_parents + 1)
+                    .subquery()
                 )
+                .scalar_subquery()
+                < self.max_parents
+            )
+        insert_stmt = PIDRelation.__table__.insert().from_select(
+            ["parent_id", "child_id", "relation_type", "index"],
+            select(
+                literal(parent_id),
+                literal(child_pid.id),
+                literal(rtid),
+                null(),
+            ).where(and_(*conditions)),
+        )
+        try:
+            with _savepoint_context():
+                result = db.session.execute(insert_stmt)
         except IntegrityError:
+            # The NOT EXISTS guard only sees duplicates visible in this
+            # transaction; a concurrent insert still surfaces here.
             raise PIDRelationConsistencyError("PID Relation already exists.")
+        finally:
+            self._invalidate_relations_cache()
+        if result.rowcount == 0:
+            # Failure path only: find out which condition rejected the insert.
+            self._check_child_limits(child_pid)
+            raise PIDRelationConsistencyError("PID Relation already exists.")
+        return self._get_child_relation(child_pid)
 
     def remove_child(self, child_pid):
         """Remove a child from a PID concept."""
-        with db.session.begin_nested():
+        with _savepoint_context():
             if not isinstance(child_pid, PersistentIdentifier):
                 child_pid = resolve_pid(child_pid)
-            stmt = select(PIDRelation).filter_by(
-                parent=self._resolved_pid,
-                child=child_pid,
-                relation_type=self.relation_type.id,
-            )
-            relation = db.session.execute(stmt).scalar_one()
+            relation = self._get_child_relation(child_pid)
             db.session.delete(relation)
+        self._invalidate_relations_cache()
 
 
 class PIDNodeOrdered(PIDNode):
@@ -285,13 +662,7 @@ class PIDNodeOrdered(PIDNode):
         """Index of the child in the relation."""
         if not isinstance(child_pid, PersistentIdentifier):
             child_pid = resolve_pid(child_pid)
-        stmt = select(PIDRelation).filter_by(
-            parent=self._resolved_pid,
-            child=child_pid,
-            relation_type=self.relation_type.id,
-        )
-        relation = db.session.execute(stmt).scalar_one()
-        return relation.index
+        return self._get_child_relation(child_pid).index
 
     def is_last_child(self, child_pid):
         """
@@ -313,8 +684,31 @@ class PIDNodeOrdered(PIDNode):
         If the 'pid' is a Head PID, return the latest of its children.
         If the 'pid' is a Version PID, return the latest of its siblings.
         Return None for the non-versioned PIDs.
+
+        This is the most frequent read on versioned record pages, so it is
+        issued as one direct statement without alias indirection; the
+        (parent_id, relation_type, index) index satisfies it with a
+        reverse index scan regardless of the number of children.
+        """
+        return db.session.scalar(self._last_child_stmt())
+
+    def _last_child_stmt(self):
+        """Build the direct last-child statement.
+
+        Subclasses restricting their children (e.g. by status) add their
+        conditions on top of the returned statement.
         """
-        return self.children.filter(PIDRelation.index.isnot(None)).ordered().first()
+        return (
+            select(PersistentIdentifier)
+            .join(PIDRelation, PIDRelation.child_id == PersistentIdentifier.id)
+            .where(
+                PIDRelation.parent_id == self._resolved_pid.id,
+                PIDRelation.relation_type == self.relation_type.id,
+                PIDRelation.index.isnot(None),
+            )
+            .order_by(PIDRelation.index.desc())
+            .limit(1)
+        )
 
     def next_child(self, child_pid):
         """Get the next child PID in the PID relation."""
@@ -352,49 +746,116 @@ class PIDNodeOrdered(PIDNode):
                   have PIDRelation.index information.
 
         """
+        # Resolve before any other database work so that the limit checks
+        # use the resolved id and a failed resolution costs nothing else.
+        if not isinstance(child_pid, PersistentIdentifier):
+            child_pid = resolve_pid(child_pid)
         self._check_child_limits(child_pid)
         if index is None:
             index = -1
+        parent_pid = self._resolved_pid
+        rtid = self.relation_type.id
+        try:
+            if index == -1:
+                # Append: the next index is computed by the database as
+                # part of the INSERT itself, a single statement.
+                index = (
+                    select(db.func.coalesce(db.func.max(PIDRelation.index), -1) + 1)
+                    .where(
+                        PIDRelation.parent_id == parent_pid.id,
+                        PIDRelation.relation_type == rtid,
+                    )
+                    .scalar_subquery()
+                )
+                with _savepoint_context():
+                    PIDRelation.create(parent_pid, child_pid, rtid, index)
+            else:
+                # Shift all siblings at or after the insertion point in a
+                # single UPDATE instead of one UPDATE per sibling. Shift
+                # and INSERT must stay atomic: always a real savepoint so
+                # that a failed insert does not leave the +1 shift applied.
+                with db.session.begin_nested():
+                    db.session.execute(
+                        update(PIDRelation)
+                        .where(
+                            PIDRelation.parent_id == parent_pid.id,
+                            PIDRelation.relation_type == rtid,
+                            PIDRelation.index >= index,
+                        )
+                        .values(index=PIDRelation.index + 1)
+                    )
+                    PIDRelation.create(parent_pid, child_pid, rtid, index)
+        except IntegrityError:
+            raise PIDRelationConsistencyError("PID Relation already exists.")
+        finally:
+            self._invalidate_relations_cache()
+
+    def insert_children(self, child_pids):
+        """Append the given PIDs as children in one batch.
+
+        The children are appended at the end of the order with contiguous
+        indexes, using one executemany INSERT for the whole batch.
+        """
+        children = self._resolve_child_pids(list(child_pids))
+        if not children:
+            return
+        self._check_children_limits(children)
+        parent_id = self._resolved_pid.id
+        rtid = self.relation_type.id
         try:
+            # Always a real savepoint: the index lookup and the executemany
+            # INSERT are a multi-statement unit, and a duplicate in the
+            # batch must not abort the enclosing transaction on PostgreSQL.
             with db.session.begin_nested():
-                if not isinstance(child_pid, PersistentIdentifier):
-                    child_pid = resolve_pid(child_pid)
-                stmt = (
-                    select(PIDRelation)
-                    .filter(
-                        PIDRelation.parent_id == self._resolved_pid.id,
-                        PIDRelation.relation_type == self.relation_type.id,
+                next_index = db.session.scalar(
+                    select(
+                        db.func.coalesce(db.func.max(PIDRelation.index), -1) + 1
+                    ).where(
+                        PIDRelation.parent_id == parent_id,
+                        PIDRelation.relation_type == rtid,
                     )
-                    .order_by(PIDRelation.index)
                 )
-                child_relations = db.session.execute(stmt).scalars().all()
-                relation_obj = PIDRelation.create(
-                    self._resolved_pid, child_pid, self.relation_type.id, None
+                db.session.execute(
+                    insert(PIDRelation),
+                    [
+                        dict(
+                            parent_id=parent_id,
+                            child_id=child.id,
+                            relation_type=rtid,
+                            index=next_index + position,
+                        )
+                        for position, child in enumerate(children)
+                    ],
                 )
-                if index == -1:
-                    child_relations.append(relation_obj)
-                else:
-                    child_relations.insert(index, relation_obj)
-                for idx, c in enumerate(child_relations):
-                    c.index = idx
         except IntegrityError:
             raise PIDRelationConsistencyError("PID Relation already exists.")
+        finally:
+            self._invalidate_relations_cache()
 
     def remove_child(self, child_pid, reorder=False):
         """Remove a child from a PID concept."""
-        super(PIDNodeOrdered, self).remove_child(child_pid)
-        stmt = (
-            select(PIDRelation)
-            .filter(
-                PIDRelation.parent_id == self._resolved_pid.id,
-                PIDRelation.relation_type == self.relation_type.id,
-            )
-            .order_by(PIDRelation.index)
-        )
-        child_relations = db.session.execute(stmt).scalars().all()
+        if not isinstance(child_pid, PersistentIdentifier):
+            child_pid = resolve_pid(child_pid)
+        removed_index = None
         if reorder:
-            for idx, c in enumerate(child_relations):
-                c.index = idx
+            removed_index = self._get_child_relation(child_pid).index
+        if removed_index is not None:
+            # Close the gap left by the removed child in a single UPDATE
+            # instead of one UPDATE per sibling. Delete and shift must stay
+            # atomic, so this path always gets a real savepoint.
+            with db.session.begin_nested():
+                super(PIDNodeOrdered, self).remove_child(child_pid)
+                db.session.execute(
+                    update(PIDRelation)
+                    .where(
+                        PIDRelation.parent_id == self._resolved_pid.id,
+                        PIDRelation.relation_type == self.relation_type.id,
+                        PIDRelation.index > removed_index,
+                    )
+                    .values(index=PIDRelation.index - 1)
+                )
+        else:
+            super(PIDNodeOrdered, self).remove_child(child_pid)
 
 
 __all__ = (
@@ -12,6 +12,16 @@ from collections import namedtuple
 
 RelationType = namedtuple("RelationType", ["id", "name", "label", "api", "schema"])
 
+PIDRELATIONS_USE_SAVEPOINT = False
+"""Wrap single-statement relation inserts/deletes in a SAVEPOINT.
+
+Each savepoint costs an extra SAVEPOINT/RELEASE round-trip pair, so by
+default lone statements rely on the caller's transaction for rollback
+semantics. Multi-statement operations (ordered inserts that shift
+siblings, reordering removals, batch inserts) always run inside a
+savepoint regardless of this setting, as they could partially fail.
+"""
+
 PIDRELATIONS_RELATION_TYPES = [
     RelationType(
         0,
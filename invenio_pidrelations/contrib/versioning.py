@@ -12,7 +12,7 @@ from __future__ import absolute_import, print_function
 
 from flask import Blueprint
 from invenio_db import db
-from invenio_pidstore.models import PIDStatus
+from invenio_pidstore.models import PersistentIdentifier, PIDStatus
 
 from invenio_pidrelations.contrib.draft import PIDNodeDraft
 
@@ -89,6 +89,19 @@ class PIDNodeVersioning(PIDNodeOrdered):
             super(PIDNodeVersioning, self).remove_child(child_pid, reorder=True)
             self.update_redirect()
 
+    @property
+    def last_child(self):
+        """Get the latest REGISTERED version PID.
+
+        Restricts the direct last-child statement to the REGISTERED
+        children, matching the :attr:`children` filter.
+        """
+        return db.session.scalar(
+            self._last_child_stmt().where(
+                PersistentIdentifier.status == PIDStatus.REGISTERED
+            )
+        )
+
     @property
     def draft_child(self):
         """Get the draft (RESERVED) child."""
@@ -45,3 +45,18 @@ class InvenioPIDRelations(object):
         for k in dir(config):
             if k.startswith("PIDRELATIONS_"):
                 app.config.setdefault(k, getattr(config, k))
+        # Every public PIDNode method talks to the database, so under
+        # concurrency the session blocks on pool exhaustion unless the pool
+        # is sized explicitly. pool_pre_ping avoids stale-connection errors
+        # after a database restart. Applications with their own
+        # SQLALCHEMY_ENGINE_OPTIONS keep their settings.
+        app.config.setdefault(
+            "SQLALCHEMY_ENGINE_OPTIONS",
+            {
+                "pool_size": 5,
+                "max_overflow": 10,
+                "pool_timeout": 30,
+                "pool_recycle": 1800,
+                "pool_pre_ping": True,
+            },
+        )
@@ -30,6 +30,20 @@ class PIDRelation(db.Model, Timestamp):
 
     __tablename__ = "pidrelations_pidrelation"
 
+    __table_args__ = (
+        db.Index(
+            "ix_pidrelations_pidrelation_parent_relation_index",
+            "parent_id",
+            "relation_type",
+            "index",
+        ),
+        db.Index(
+            "ix_pidrelations_pidrelation_child_relation",
+            "child_id",
+            "relation_type",
+        ),
+    )
+
     parent_id = db.Column(
         db.Integer,
         db.ForeignKey(PersistentIdentifier.id, onupdate="CASCADE", ondelete="CASCADE"),
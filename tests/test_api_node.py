@@ -10,12 +10,29 @@
 
 import pytest
 from invenio_pidstore.models import PersistentIdentifier, PIDStatus
-from test_helpers import create_pids, filter_pids, with_pid_and_fetched_pid
-
-from invenio_pidrelations.api import PIDNode, PIDNodeOrdered
+from test_helpers import (
+    create_pids,
+    filter_pids,
+    pid_to_fetched_recid,
+    with_pid_and_fetched_pid,
+)
+
+from invenio_pidrelations.api import PIDNode, PIDNodeOrdered, resolve_pids
 from invenio_pidrelations.errors import PIDRelationConsistencyError
 
 
+def test_resolve_pids(db, version_pids):
+    """Test resolve_pids()."""
+    pids = [version_pids[0]["parent"]] + version_pids[0]["children"]
+    fetched_pids = [pid_to_fetched_recid(pid) for pid in pids]
+    resolved = resolve_pids(fetched_pids)
+    assert len(resolved) == len(pids)
+    for fetched, pid in zip(fetched_pids, pids):
+        key = (fetched.pid_type, fetched.pid_value, fetched.provider.pid_provider)
+        assert resolved[key] == pid
+    assert resolve_pids([]) == {}
+
+
 @with_pid_and_fetched_pid
 def test_node_children(db, version_relation, version_pids, build_pid):
     """Test PIDNode.children()."""
@@ -33,6 +50,33 @@ def test_node_children(db, version_relation, version_pids, build_pid):
     assert child_node.children.ordered("asc").all() == []
 
 
+@with_pid_and_fetched_pid
+def test_node_descendants_and_ancestors(db, version_relation, version_pids, build_pid):
+    """Test PIDNode.descendants() and PIDNode.ancestors()."""
+    parent_node = PIDNode(build_pid(version_pids[0]["parent"]), version_relation)
+    child_node = PIDNode(build_pid(version_pids[0]["children"][0]), version_relation)
+    grandchild = create_pids(1)[0]
+    child_node.insert_child(grandchild)
+
+    # All transitively connected children are retrieved in one query.
+    assert set(parent_node.descendants().all()) == set(
+        version_pids[0]["children"] + [grandchild]
+    )
+    # Traversal depth can be limited.
+    assert set(parent_node.descendants(max_depth=1).all()) == set(
+        version_pids[0]["children"]
+    )
+
+    grandchild_node = PIDNode(grandchild, version_relation)
+    assert set(grandchild_node.ancestors().all()) == {
+        version_pids[0]["parent"],
+        version_pids[0]["children"][0],
+    }
+    assert grandchild_node.ancestors(max_depth=1).all() == [
+        version_pids[0]["children"][0]
+    ]
+
+
 @with_pid_and_fetched_pid
 def test_node_is_parent(db, version_relation, version_pids, build_pid):
     """Test PIDNode.is_parent."""
@@ -67,6 +111,47 @@ def test_node_insert_child(db, version_relation, version_pids, build_pid, recids
     assert child_node.parents.all() == [version_pids[0]["parent"]]
 
 
+@with_pid_and_fetched_pid
+def test_node_insert_children(db, version_relation, version_pids, build_pid, recids):
+    """Test PIDNode.insert_children."""
+    parent_pid = build_pid(version_pids[0]["parent"])
+    parent_node = PIDNode(parent_pid, version_relation)
+    child_pids = create_pids(3)
+
+    parent_node.insert_children([build_pid(pid) for pid in child_pids])
+    for child_pid in child_pids:
+        assert PIDNode(child_pid, version_relation).parents.all() == [
+            version_pids[0]["parent"]
+        ]
+
+    # Inserting an already related child raises.
+    with pytest.raises(PIDRelationConsistencyError):
+        parent_node.insert_children([child_pids[0]])
+
+    # The batch counts against max_children as a whole.
+    limited_node = PIDNode(
+        parent_pid,
+        version_relation,
+        max_children=len(parent_node.children.all()) + 1,
+    )
+    with pytest.raises(PIDRelationConsistencyError):
+        limited_node.insert_children(create_pids(2, prefix="limited"))
+
+
+@with_pid_and_fetched_pid
+def test_ordered_node_insert_children(
+    db, version_relation, version_pids, build_pid, recids
+):
+    """Test the PIDNodeOrdered insert_children method."""
+    parent_pid = build_pid(version_pids[0]["parent"])
+    ordered_parent_node = PIDNodeOrdered(parent_pid, version_relation)
+    child_pids = create_pids(3)
+
+    ordered_parent_node.insert_children([build_pid(pid) for pid in child_pids])
+    version_pids[0]["children"].extend(child_pids)
+    assert_children_indices(ordered_parent_node, version_pids[0]["children"])
+
+
 @with_pid_and_fetched_pid
 def test_node_remove_child(db, version_relation, version_pids, build_pid, recids):
     """Test PIDNode.remove_child."""
@@ -258,6 +343,22 @@ def test_node_max_parents(db, version_relation, version_pids, build_pid, recids)
         ordered_parent_node_2.insert_child(child_pids[0])
 
 
+@with_pid_and_fetched_pid
+def test_node_insert_children_max_parents(
+    db, version_relation, version_pids, build_pid, recids
+):
+    """Test the PIDNode max parents attribute with insert_children."""
+    parent_pid_1 = build_pid(version_pids[0]["parent"])
+    parent_pid_2 = build_pid(version_pids[1]["parent"])
+    parent_node_1 = PIDNode(parent_pid_1, version_relation, max_parents=1)
+    parent_node_2 = PIDNode(parent_pid_2, version_relation, max_parents=1)
+    child_pids = create_pids(1)
+
+    parent_node_1.insert_children(child_pids)
+    with pytest.raises(PIDRelationConsistencyError):
+        parent_node_2.insert_children(child_pids)
+
+
 @with_pid_and_fetched_pid
 def test_node_max_children(db, version_relation, version_pids, build_pid, recids):
     """Test the PIDNode max children attribute."""
@@ -38,6 +38,17 @@ def test_query_order(db, version_pids, order, sort):
     assert result == sort(version_pids[0]["children"])
 
 
+def test_query_iter(db, version_pids):
+    """Test PIDQuery.iter()."""
+    query = (
+        PIDQuery(select(PersistentIdentifier), db.session)
+        .join(PIDRelation, PersistentIdentifier.id == PIDRelation.child_id)
+        .filter(PIDRelation.parent_id == version_pids[0]["parent"].id)
+        .ordered("asc")
+    )
+    assert list(query.iter(batch=2)) == version_pids[0]["children"]
+
+
 @pytest.mark.parametrize(
     "status, filt",
     [